@@ -1,10 +1,10 @@
 """
 설정 관리 모듈
-환경변수 기반 설정을 dataclass로 관리
+환경변수 기반 설정을 dataclass로 관리 (생성 후 변경 불가: frozen)
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import os
 from pathlib import Path
 
@@ -70,7 +70,7 @@ TOR_REQUIRED_DISTRICTS = ["HAEUNDAE", "JINGU", "GEUMJEONG", "SASANG", "JUNGGU"]
 
 # ==================== 메시지 템플릿 ====================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MessageTemplates:
     """텔레그램 메시지 템플릿"""
 
@@ -112,7 +112,7 @@ class MessageTemplates:
     district_attempt: str = "{district} 시도 중"
 
     # 번호 매기기용 (①②③...)
-    numbered_markers: tuple = ("①", "②", "③", "④", "⑤", "⑥", "⑦", "⑧", "⑨", "⑩")
+    numbered_markers: Tuple[str, ...] = ("①", "②", "③", "④", "⑤", "⑥", "⑦", "⑧", "⑨", "⑩")
 
     def format_funeral_title(self, district: str, update_count: int) -> str:
         """부고 제목 포맷팅"""
@@ -121,20 +121,19 @@ class MessageTemplates:
         return self.funeral_updated.format(district=district, version=update_count)
 
     def format_funeral_info(self, data: Dict[str, str]) -> str:
-        """부고 정보 항목들 포맷팅"""
-        lines = []
-        for i, (key, value) in enumerate(data.items()):
-            if i < len(self.numbered_markers):
-                num = self.numbered_markers[i]
-                lines.append(self.funeral_info_item.format(num=num, key=key, value=value))
-        return "\n".join(lines)
+        """부고 정보 항목들 포맷팅 (번호 + 항목명 + 값, 최대 마커 개수까지)"""
+        item = self.funeral_info_item
+        return "\n".join(
+            item.format(num=num, key=key, value=value)
+            for num, (key, value) in zip(self.numbered_markers, data.items())
+        )
 
 
 # 기본 메시지 템플릿 인스턴스
 DEFAULT_TEMPLATES = MessageTemplates()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TelegramConfig:
     """텔레그램 설정"""
     bot_token: str
@@ -145,26 +144,24 @@ class TelegramConfig:
     templates: MessageTemplates = field(default_factory=MessageTemplates)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TorConfig:
     """Tor 프록시 설정"""
     enabled: bool = True
     host: str = "127.0.0.1"
     port: int = 9050
+    # 요청마다 재생성하지 않도록 생성 시 1회 계산
+    proxy_url: str = field(init=False, repr=False)
+    proxies: Dict[str, str] = field(init=False, repr=False)
 
-    @property
-    def proxy_url(self) -> str:
-        return f"socks5://{self.host}:{self.port}"
-
-    @property
-    def proxies(self) -> Dict[str, str]:
-        return {
-            "http": self.proxy_url,
-            "https": self.proxy_url
-        }
+    def __post_init__(self):
+        # frozen dataclass이므로 object.__setattr__로 파생 값 설정
+        proxy_url = f"socks5://{self.host}:{self.port}"
+        object.__setattr__(self, "proxy_url", proxy_url)
+        object.__setattr__(self, "proxies", {"http": proxy_url, "https": proxy_url})
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PocketbaseConfig:
     """Pocketbase 설정"""
     url: str
@@ -172,7 +169,7 @@ class PocketbaseConfig:
     password: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """전체 설정"""
     telegram: TelegramConfig
@@ -181,6 +178,7 @@ class Config:
     openai_api_key: str
     max_page_num: int = 1
     schedule_interval_minutes: int = 15
+    scrape_workers: int = 8  # 구청 동시 수집 수 (1이면 순차 실행)
     log_file: str = "log.txt"
     base_dir: Path = field(default_factory=lambda: Path(__file__).parent)
 
@@ -216,6 +214,7 @@ def load_config() -> Config:
         openai_api_key=os.getenv("OPENAI_API_KEY"),
         max_page_num=int(os.getenv("MAX_PAGE_NUM")),
         schedule_interval_minutes=int(os.getenv("SCHEDULE_INTERVAL_MINUTES")),
+        scrape_workers=int(os.getenv("SCRAPE_WORKERS", "8")),
         log_file=os.getenv("LOG_FILE", "log.txt"),
     )
 
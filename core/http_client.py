@@ -8,6 +8,7 @@ import requests
 import time
 import random
 import socket
+import threading
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from urllib3 import disable_warnings
@@ -16,9 +17,6 @@ from typing import Optional, Dict
 import logging
 from urllib.parse import urlparse
 
-from random_user_agent.user_agent import UserAgent
-from random_user_agent.params import SoftwareName, OperatingSystem
-
 # 주의: 실제 환경에서는 config.py가 존재해야 합니다.
 try:
     from config import Config
@@ -36,16 +34,33 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 logger = logging.getLogger(__name__)
 
 
+# User-Agent 풀 (Windows/Linux Chrome 최신 버전대)
+_STATIC_UA_POOL = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+)
+
+
 def get_random_user_agent() -> str:
-    """랜덤 User-Agent 생성 (Windows/Linux Chrome 위주)"""
-    software_names = [SoftwareName.CHROME.value]
-    operating_systems = [OperatingSystem.WINDOWS.value, OperatingSystem.LINUX.value]
-    user_agent_rotator = UserAgent(
-        software_names=software_names,
-        operating_systems=operating_systems,
-        limit=100
-    )
-    return user_agent_rotator.get_random_user_agent()
+    """랜덤 User-Agent 선택 (Windows/Linux Chrome 위주)"""
+    return random.choice(_STATIC_UA_POOL)
 
 
 class HttpClient:
@@ -60,11 +75,15 @@ class HttpClient:
 
     BLOCKED_STATUS_CODES = {403, 429, 503}
     IP_CHECK_URL = "https://api.ipify.org"
+    # 16개 구청 호스트가 스케줄 간 keep-alive 연결을 유지하도록 여유 있게 설정
+    POOL_SIZE = 32
 
     def __init__(self, config: Config):
         self.config = config
         self.tor_config = config.tor
         self.session = self._create_session()
+        # Tor 요청용 세션은 워커 스레드마다 1개씩 유지 (쿠키 저장소 분리 + Tor 연결 재사용)
+        self._tor_local = threading.local()
         
         # 초기 직접 연결 IP 확인
         self.origin_ip = self._get_current_ip()
@@ -78,7 +97,13 @@ class HttpClient:
             backoff_factor=1,
             status_forcelist=[500, 502, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # Tor 요청은 어댑터 내부에서 프록시별 풀(proxy_manager)로 분리되어 직접 연결 풀과 섞이지 않음
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            pool_block=False,
+        )
         session.mount('http://', adapter)
         session.mount('https://', adapter)
 
@@ -176,6 +201,21 @@ class HttpClient:
                 return self._get_with_tor(url, 'POST', data=data, params=params, **kwargs)
             raise
 
+    def _get_tor_session(self) -> requests.Session:
+        """현재 스레드의 Tor 세션 반환 (없으면 생성)"""
+        session = getattr(self._tor_local, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._tor_local.session = session
+        return session
+
+    def _reset_tor_session(self):
+        """현재 스레드의 Tor 세션 폐기 (회로 갱신 후 기존 회로의 keep-alive 연결을 재사용하지 않도록)"""
+        session = getattr(self._tor_local, "session", None)
+        if session is not None:
+            session.close()
+            self._tor_local.session = None
+
     def _is_blocked(self, error: requests.exceptions.HTTPError) -> bool:
         """차단 여부 판단"""
         return error.response is not None and error.response.status_code in self.BLOCKED_STATUS_CODES
@@ -186,7 +226,10 @@ class HttpClient:
         kwargs['timeout'] = max(kwargs.get('timeout', 30), 60)
         
         # 세션 초기화 및 헤더 갱신
-        self.session.cookies.clear()
+        # 공유 세션의 쿠키를 비우면 병렬 수집 중인 다른 구청 요청까지 영향을 받으므로
+        # 현재 스레드 전용 Tor 세션의 쿠키만 비움
+        tor_session = self._get_tor_session()
+        tor_session.cookies.clear()
         self._apply_headers(url, kwargs)
         kwargs['headers']['Sec-Fetch-Site'] = 'same-origin'
         kwargs['headers']['Sec-Fetch-Mode'] = 'navigate'
@@ -197,9 +240,9 @@ class HttpClient:
         
         try:
             if method == 'GET':
-                response = self.session.get(url, **kwargs)
+                response = tor_session.get(url, **kwargs)
             else:
-                response = self.session.post(url, data=data, params=params, **kwargs)
+                response = tor_session.post(url, data=data, params=params, **kwargs)
             
             response.raise_for_status()
             return response
@@ -209,12 +252,17 @@ class HttpClient:
             if self._is_blocked(e) and retry_count < 1:
                 logger.warning(f"Tor IP({after_ip})도 차단됨. 회로 갱신 후 재시도합니다.")
                 self._renew_tor_circuit()
+                self._reset_tor_session()
                 time.sleep(random.uniform(2.0, 5.0))
                 return self._get_with_tor(url, method, data=data, params=params, retry_count=retry_count + 1, **kwargs)
             raise
 
     def get_text(self, url: str, encoding: str = "utf-8", **kwargs) -> str:
-        """GET 요청 후 텍스트 반환"""
+        """GET 요청 후 텍스트 반환 (인코딩 자동 감지 없이 바이트를 직접 디코딩)"""
         response = self.get(url, **kwargs)
-        response.encoding = encoding
-        return response.text
+        return response.content.decode(encoding, errors="replace")
+
+    def post_text(self, url: str, encoding: str = "utf-8", **kwargs) -> str:
+        """POST 요청 후 텍스트 반환 (인코딩 자동 감지 없이 바이트를 직접 디코딩)"""
+        response = self.post(url, **kwargs)
+        return response.content.decode(encoding, errors="replace")
@@ -5,6 +5,7 @@
 
 import traceback
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 
 from config import Config, DISTRICT_NAMES_ENG_TO_KOR
@@ -88,38 +89,25 @@ class Pipeline:
                 self._save_metrics()
 
     def _collect_raw_data(self):
-        """1단계: RAW 데이터 수집"""
+        """1단계: RAW 데이터 수집 (구청별 병렬 실행)"""
         collect_summary = {}  # 구청별 수집 결과
 
-        for district_code in SCRAPER_CLASSES.keys():
-            district_kor = DISTRICT_NAMES_ENG_TO_KOR.get(district_code, district_code)
-            self._log_general(f"{district_kor} 시도 중")
-
-            with self.metrics.measure_district(district_code) as result:
-                try:
-                    scraper = create_scraper(district_code, self.http_client)
-                    scraped_data = scraper.scrape(self.config.max_page_num)
-
-                    # DB에 저장
-                    saved_count = self._save_raw_data(district_kor, scraped_data)
-                    result["items"] = saved_count
-                    result["success"] = True
-
-                    # 새로 수집된 것만 기록
-                    if saved_count > 0:
-                        collect_summary[district_kor] = saved_count
-
-                except Exception as e:
-                    err_msg = traceback.format_exc()
-                    self._log_error(
-                        f"public_funeral.{district_code}",
-                        err_msg,
-                        f"실패(type:{type(e).__name__})"
-                    )
-                    result["success"] = False
-                    result["error"] = str(e)
-                    # 개별 스크래퍼 실패는 무시하고 다음 구청으로 계속 진행
-                    continue
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.config.scrape_workers),
+            thread_name_prefix="district"
+        ) as executor:
+            futures = {
+                district_code: executor.submit(self._collect_district, district_code)
+                for district_code in SCRAPER_CLASSES.keys()
+            }
+
+            # 결과는 구청 등록 순서대로 집계
+            for district_code, future in futures.items():
+                saved_count = future.result()
+                # 새로 수집된 것만 기록
+                if saved_count > 0:
+                    district_kor = DISTRICT_NAMES_ENG_TO_KOR.get(district_code, district_code)
+                    collect_summary[district_kor] = saved_count
 
         # 수집 요약 로그
         if collect_summary:
@@ -129,6 +117,38 @@ class Pipeline:
         else:
             self._log_general("📥 RAW 수집 결과: 새로 수집된 데이터 없음")
 
+    def _collect_district(self, district_code: str) -> int:
+        """구청 1곳 수집 및 저장 (워커 스레드에서 실행)
+
+        Returns:
+            새로 저장된 건수 (실패 시 0)
+        """
+        district_kor = DISTRICT_NAMES_ENG_TO_KOR.get(district_code, district_code)
+        self._log_general(f"{district_kor} 시도 중")
+
+        with self.metrics.measure_district(district_code) as result:
+            try:
+                scraper = create_scraper(district_code, self.http_client)
+                scraped_data = scraper.scrape(self.config.max_page_num)
+
+                # DB에 저장
+                saved_count = self._save_raw_data(district_kor, scraped_data)
+                result["items"] = saved_count
+                result["success"] = True
+                return saved_count
+
+            except Exception as e:
+                err_msg = traceback.format_exc()
+                self._log_error(
+                    f"public_funeral.{district_code}",
+                    err_msg,
+                    f"실패(type:{type(e).__name__})"
+                )
+                result["success"] = False
+                result["error"] = str(e)
+                # 개별 스크래퍼 실패는 무시하고 다른 구청은 계속 진행
+                return 0
+
     def _save_raw_data(self, district_kor: str, scraped_data: List[Dict]) -> int:
         """스크래핑 데이터를 DB에 저장"""
         saved = 0
@@ -166,17 +186,24 @@ class Pipeline:
         analyze_summary = {}  # 구청별 분석 결과
         total_count = len(unanalyzed)
 
-        for idx, raw_item in enumerate(unanalyzed, 1):
+        # GPT 요청은 병렬로 보내고, 결과는 입력 순서대로 받아 즉시 저장
+        results = self.gpt.analyze_many([
+            {
+                "url": raw_item["url"],
+                "content": raw_item["content"],
+                "updated": raw_item.get("update_count", 0)
+            }
+            for raw_item in unanalyzed
+        ])
+
+        for idx, (raw_item, result) in enumerate(zip(unanalyzed, results), 1):
             # 진행상황 출력
             name_preview = raw_item.get("content", "")[:30].replace("\n", " ")
-            print(f"  [{idx}/{total_count}] {raw_item['district']} 분석 중... ({name_preview}...)")
+            print(f"  [{idx}/{total_count}] {raw_item['district']} 분석 처리 ({name_preview}...)")
             try:
-                # GPT 분석
-                result = self.gpt.analyze_raw_data({
-                    "url": raw_item["url"],
-                    "content": raw_item["content"],
-                    "updated": raw_item.get("update_count", 0)
-                })
+                # GPT 분석 실패 시 원래 예외(트레이스백 포함)를 다시 발생
+                if isinstance(result, Exception):
+                    raise result
 
                 # 분석 결과 저장
                 self.db.add_analyzed(
@@ -9,6 +9,7 @@ import logging
 from typing import Callable, Optional
 
 from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 
@@ -26,6 +27,7 @@ class FuneralScheduler:
     - 시작 시 즉시 1회 실행
     - Graceful shutdown 지원
     - 실행 이력 로깅
+    - 작업은 동기 실행 (구청별 병렬 수집은 Pipeline 내부 스레드 풀에서 처리)
     """
 
     def __init__(
@@ -43,7 +45,11 @@ class FuneralScheduler:
         self.config = config
         self.job_func = job_func
         self.on_error = on_error
-        self.scheduler = BlockingScheduler()
+        # 초기 실행과 주기 실행은 job id가 달라 max_instances로 막히지 않으므로
+        # 작업 스레드를 1개로 두어 파이프라인이 겹쳐 실행(중복 전송)되지 않게 함
+        self.scheduler = BlockingScheduler(
+            executors={'default': ThreadPoolExecutor(max_workers=1)}
+        )
         self._setup_signal_handlers()
         self._setup_listeners()
 
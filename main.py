@@ -12,15 +12,14 @@
 import argparse
 import logging
 import sys
+from typing import TYPE_CHECKING
 
 from config import load_config, get_config
-from core.http_client import HttpClient
-from core.pipeline import Pipeline
-from core.scheduler import FuneralScheduler
 from services.pocketbase import PocketbaseClient
-from services.telegram import TelegramService
-from services.gpt_analyzer import GPTAnalyzer
-from utils.logger import get_logger
+
+# 파이프라인/스케줄러 관련 모듈(bs4, apscheduler 등)은 실제로 쓰는 실행 모드에서만 import
+if TYPE_CHECKING:
+    from core.pipeline import Pipeline
 
 
 def setup_logging():
@@ -32,8 +31,14 @@ def setup_logging():
     )
 
 
-def create_pipeline(config) -> Pipeline:
+def create_pipeline(config) -> "Pipeline":
     """파이프라인 생성"""
+    from core.http_client import HttpClient
+    from core.pipeline import Pipeline
+    from services.telegram import TelegramService
+    from services.gpt_analyzer import GPTAnalyzer
+    from utils.logger import get_logger
+
     http_client = HttpClient(config)
     db = PocketbaseClient(config.pocketbase)
     telegram = TelegramService(config.telegram)
@@ -66,12 +71,15 @@ def create_pipeline(config) -> Pipeline:
 
 def run_scheduler(config):
     """스케줄러 모드로 실행"""
+    from core.scheduler import FuneralScheduler
+
     pipeline = create_pipeline(config)
+    # 에러 알림은 파이프라인의 텔레그램 서비스를 재사용 (에러마다 재생성하지 않음)
+    telegram = pipeline.telegram
 
     def on_error(e):
         """에러 발생 시 텔레그램 알림"""
         try:
-            telegram = TelegramService(config.telegram)
             telegram.send_error_notification(
                 "Scheduler",
                 str(e),
@@ -11,7 +11,15 @@ import json
 import hashlib
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
+from typing import Dict, Optional, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from config import Config
 from services.pocketbase import PocketbaseClient
@@ -19,6 +27,18 @@ from services.pocketbase import PocketbaseClient
 logger = logging.getLogger(__name__)
 KST = timezone(timedelta(hours=9))
 
+# batch API 1회 요청당 레코드 수 (Pocketbase batch maxRequests 기본값 50 이하)
+BATCH_SIZE = 50
+
+# 레코드 단위 요청 동시 실행 수
+MAX_WORKERS = 16
+
+# content_hash → raw_id 매핑 로컬 캐시 (base_dir 기준)
+RAW_ID_CACHE_PATH = Path(".cache") / "raw_id_map.json"
+
+# 증분 조회 기준 필드 (add_raw가 항상 기록하는 수집 시각)
+RAW_ID_CURSOR_FIELD = "scraped_at"
+
 
 def load_json_file(file_path: Path) -> dict:
     """JSON 파일 로드"""
@@ -26,6 +46,10 @@ def load_json_file(file_path: Path) -> dict:
         logger.warning(f"파일 없음: {file_path}")
         return {}
 
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -49,6 +73,12 @@ def migrate_raw_data(db: PocketbaseClient, base_dir: Path) -> int:
     if not data:
         return 0
 
+    # 저장된 (content, district) 목록을 한 번에 조회
+    existing_keys = db.get_raw_keys()
+    if existing_keys is None:
+        logger.error("RAW 목록 조회 실패 - 중복 저장 방지를 위해 RAW 마이그레이션 건너뜀")
+        return 0
+
     count = 0
     for district, items in data.items():
         for item in items:
@@ -56,8 +86,9 @@ def migrate_raw_data(db: PocketbaseClient, base_dir: Path) -> int:
             content = item.get("content", "")
             updated = item.get("updated", 0)
 
-            # 이미 존재하는지 확인
-            if db.raw_exists(content, district):
+            # 이미 존재하는지 확인 (구청 내 동일 내용)
+            key = (content, district)
+            if key in existing_keys:
                 continue
 
             # 저장
@@ -69,6 +100,7 @@ def migrate_raw_data(db: PocketbaseClient, base_dir: Path) -> int:
             )
 
             if result:
+                existing_keys.add(key)
                 count += 1
                 logger.debug(f"RAW 마이그레이션: {district} - {url[:50]}...")
 
@@ -76,19 +108,102 @@ def migrate_raw_data(db: PocketbaseClient, base_dir: Path) -> int:
     return count
 
 
-def get_raw_id_mapping(db: PocketbaseClient) -> dict:
-    """
-    funeral_raw에서 content_hash → id 매핑 조회
+def _load_raw_id_cache(cache_path: Path) -> Tuple[str, int, Dict[str, str]]:
+    """로컬 raw_id 매핑 캐시 로드 → (cursor, cursor 시점 레코드 수, 매핑)
+
+    파일이 없거나 구조가 올바르지 않으면 빈 캐시를 반환한다 (전체 조회로 진행).
     """
+    if not cache_path.exists():
+        return "", 0, {}
+    try:
+        cached = load_json_file(cache_path)
+        cursor = cached["cursor"]
+        count = cached["count"]
+        mapping = cached["map"]
+        valid = (
+            cached.get("cursor_field") == RAW_ID_CURSOR_FIELD
+            and isinstance(cursor, str)
+            and isinstance(count, int)
+            and isinstance(mapping, dict)
+            and all(isinstance(k, str) and isinstance(v, str) for k, v in mapping.items())
+        )
+    except Exception as e:
+        logger.warning(f"raw_id 매핑 캐시 로드 실패, 전체 조회로 진행: {e}")
+        return "", 0, {}
+    if not valid:
+        logger.warning("raw_id 매핑 캐시 형식이 올바르지 않음, 전체 조회로 진행")
+        return "", 0, {}
+    return cursor, count, mapping
+
+
+def _save_raw_id_cache(cache_path: Path, cursor: str, count: int, mapping: Dict[str, str]):
+    """로컬 raw_id 매핑 캐시 저장"""
+    payload = {"cursor_field": RAW_ID_CURSOR_FIELD, "cursor": cursor, "count": count, "map": mapping}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            cache_path.write_bytes(orjson.dumps(payload))
+        else:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+    except OSError as e:
+        logger.warning(f"raw_id 매핑 캐시 저장 실패: {e}")
+
+
+def _count_raw_until(db: PocketbaseClient, cursor: str) -> Optional[int]:
+    """cursor 시점까지 수집된 RAW 레코드 수 (조회 실패 시 None)"""
     result = db._request(
         "GET",
         "funeral_raw/records",
-        params={"fields": "id,content_hash", "perPage": 10000}
+        params={
+            "filter": f'{RAW_ID_CURSOR_FIELD}<="{cursor}"',
+            "fields": "id",
+            "perPage": 1
+        }
     )
-    if not result:
-        return {}
+    if result is None:
+        return None
+    return result.get("totalItems")
+
+
+def get_raw_id_mapping(db: PocketbaseClient, cache_path: Optional[Path] = None) -> Optional[Dict[str, str]]:
+    """
+    funeral_raw에서 content_hash → id 매핑 조회 (fail-closed)
+
+    cache_path가 주어지면 이전 실행의 매핑과 마지막 scraped_at 값(cursor)을 재사용하고,
+    cursor 이후에 수집된 레코드만 추가로 조회한다.
+    cursor 시점까지의 레코드 수가 캐시 저장 당시와 다르면(삭제 등) 캐시를 버리고 전체 조회한다.
+    조회 실패 시 None을 반환한다 → 호출부는 raw_id 없이 저장하지 않도록 작업을 중단할 것.
+    """
+    cursor, count, mapping = _load_raw_id_cache(cache_path) if cache_path else ("", 0, {})
+
+    if cursor:
+        current = _count_raw_until(db, cursor)
+        if current != count:
+            logger.info(f"캐시 이후 기존 RAW 레코드 변경 감지 (캐시: {count}건, 현재: {current}건), 전체 조회로 진행")
+            cursor, mapping = "", {}
 
-    return {r["content_hash"]: r["id"] for r in result.get("items", [])}
+    params = {
+        "fields": f"id,content_hash,{RAW_ID_CURSOR_FIELD}",
+        "sort": RAW_ID_CURSOR_FIELD,
+    }
+    if cursor:
+        # 같은 시각에 기록된 레코드를 놓치지 않도록 >= 로 조회 (중복은 덮어쓰기)
+        params["filter"] = f'{RAW_ID_CURSOR_FIELD}>="{cursor}"'
+
+    records = db._fetch_all_pages("funeral_raw/records", params)
+    if records is None:
+        return None
+
+    for r in records:
+        mapping[r["content_hash"]] = r["id"]
+        cursor = max(cursor, r.get(RAW_ID_CURSOR_FIELD) or "")
+
+    if cache_path and cursor:
+        count = _count_raw_until(db, cursor)
+        if count is not None:
+            _save_raw_id_cache(cache_path, cursor, count, mapping)
+    return mapping
 
 
 def migrate_analyzed_data(db: PocketbaseClient, base_dir: Path) -> int:
@@ -120,15 +235,27 @@ def migrate_analyzed_data(db: PocketbaseClient, base_dir: Path) -> int:
         return 0
 
     items = data.get("data", [])
-    existing_hashes = set(db.get_analyzed_hashes())
+    existing_hashes = db.get_content_hashes("funeral_analyzed")
+    if existing_hashes is None:
+        logger.error("분석 데이터 목록 조회 실패 - 중복 저장 방지를 위해 분석 데이터 마이그레이션 건너뜀")
+        return 0
 
     # content_hash → raw_id 매핑 조회
     print("RAW 데이터에서 content_hash → raw_id 매핑 조회 중...")
-    hash_to_raw_id = get_raw_id_mapping(db)
+    hash_to_raw_id = get_raw_id_mapping(db, base_dir / RAW_ID_CACHE_PATH)
+    if hash_to_raw_id is None:
+        logger.error("raw_id 매핑 조회 실패 - raw_id 누락 저장 방지를 위해 분석 데이터 마이그레이션 건너뜀")
+        return 0
     print(f"매핑 조회 완료: {len(hash_to_raw_id)}건")
 
-    # 마이그레이션 대상 필터링
-    to_migrate = [item for item in items if item.get("hash", "") not in existing_hashes]
+    # 마이그레이션 대상 필터링 (파일 내 중복 hash도 1건만)
+    to_migrate = []
+    for item in items:
+        content_hash = item.get("hash", "")
+        if content_hash in existing_hashes:
+            continue
+        existing_hashes.add(content_hash)
+        to_migrate.append(item)
     total = len(to_migrate)
     skipped = len(items) - total
     print(f"전체: {len(items)}건, 이미 존재: {skipped}건, 마이그레이션 대상: {total}건")
@@ -137,39 +264,65 @@ def migrate_analyzed_data(db: PocketbaseClient, base_dir: Path) -> int:
     failed = 0
     no_raw_id = 0
 
-    for i, item in enumerate(to_migrate):
-        content_hash = item.get("hash", "")
-        analyzed_content = item.get("content", {})
-
-        # content_hash로 raw_id 찾기
-        raw_id = hash_to_raw_id.get(content_hash, "")
-        if not raw_id:
-            no_raw_id += 1
-
-        result = db.add_analyzed(
-            raw_id=raw_id,
-            content_hash=content_hash,
-            district=item.get("goo", ""),
-            url=item.get("url", ""),
-            update_count=item.get("updated", 0),
-            analyzed_data=analyzed_content
-        )
-
-        if result:
-            count += 1
-        else:
-            failed += 1
-
-        # 10건마다 진행 상황 출력
-        if (i + 1) % 10 == 0 or (i + 1) == total:
-            remaining = total - (i + 1)
-            print(f"\r[analyzed] {i+1}/{total} 완료 (성공: {count}, 실패: {failed}, raw_id 없음: {no_raw_id}, 잔여: {remaining})", end="", flush=True)
+    for start in range(0, total, BATCH_SIZE):
+        chunk = to_migrate[start:start + BATCH_SIZE]
+        entries = []
+        for item in chunk:
+            content_hash = item.get("hash", "")
+
+            # content_hash로 raw_id 찾기
+            raw_id = hash_to_raw_id.get(content_hash, "")
+            if not raw_id:
+                no_raw_id += 1
+
+            entries.append({
+                "raw_id": raw_id,
+                "content_hash": content_hash,
+                "district": item.get("goo", ""),
+                "url": item.get("url", ""),
+                "update_count": item.get("updated", 0),
+                "analyzed_data": item.get("content", {})
+            })
+
+        try:
+            created = db.batch_create(
+                "funeral_analyzed",
+                [db.build_analyzed_record(**entry) for entry in entries]
+            )
+        except requests.exceptions.RequestException as e:
+            # 서버 반영 여부를 알 수 없음 → 폴백 재저장 시 중복 위험이 있으므로 중단
+            print()
+            logger.error(f"batch 결과 확인 불가 - 분석 데이터 마이그레이션 중단 (재실행 시 저장된 항목은 건너뜀): {e}")
+            break
+        if created is None:
+            # batch API 사용 불가 → 레코드 단위로 폴백 (add_analyzed가 건별로 존재 여부 확인)
+            created = sum(1 for entry in entries if db.add_analyzed(**entry))
+        count += created
+        failed += len(entries) - created
+
+        done = start + len(chunk)
+        print(f"\r[analyzed] {done}/{total} 완료 (성공: {count}, 실패: {failed}, raw_id 없음: {no_raw_id}, 잔여: {total - done})", end="", flush=True)
 
     print()  # 줄바꿈
     logger.info(f"분석 데이터 마이그레이션 완료: {count}건 (raw_id 없음: {no_raw_id}건)")
     return count
 
 
+def _mark_as_sent_if_missing(db: PocketbaseClient, content_hash: str) -> Optional[Dict]:
+    """전송 기록 추가 (이미 존재하거나 확인 실패 시 추가하지 않음)"""
+    result = db._request(
+        "GET",
+        "funeral_sent/records",
+        params={"filter": f'content_hash="{content_hash}"', "fields": "id"}
+    )
+    if result is None:
+        # 확인 실패(fail-closed) → 중복 저장 방지를 위해 건너뜀
+        return None
+    if result.get("items"):
+        return {"skipped": True, "content_hash": content_hash}
+    return db.mark_as_sent(content_hash)
+
+
 def migrate_sent_data(db: PocketbaseClient, base_dir: Path) -> int:
     """
     DB_SENDED.json → funeral_sent 마이그레이션
@@ -186,10 +339,13 @@ def migrate_sent_data(db: PocketbaseClient, base_dir: Path) -> int:
         return 0
 
     hashes = data.get("data", [])
-    existing_sent = set(db.get_sent_hashes())
+    existing_sent = db.get_content_hashes("funeral_sent")
+    if existing_sent is None:
+        logger.error("전송 기록 목록 조회 실패 - 중복 저장 방지를 위해 전송 기록 마이그레이션 건너뜀")
+        return 0
 
-    # 마이그레이션 대상 필터링
-    to_migrate = [h for h in hashes if h not in existing_sent]
+    # 마이그레이션 대상 필터링 (파일 내 중복 hash도 1건만)
+    to_migrate = list(dict.fromkeys(h for h in hashes if h not in existing_sent))
     total = len(to_migrate)
     skipped = len(hashes) - total
     print(f"전체: {len(hashes)}건, 이미 존재: {skipped}건, 마이그레이션 대상: {total}건")
@@ -197,19 +353,33 @@ def migrate_sent_data(db: PocketbaseClient, base_dir: Path) -> int:
     count = 0
     failed = 0
 
-    for i, content_hash in enumerate(to_migrate):
-        result = db.mark_as_sent(content_hash)
-        # 전송 dedup의 단일 진실원천(analyzed.is_sent)도 함께 갱신
-        db.mark_analyzed_sent_by_hash(content_hash)
-        if result:
-            count += 1
-        else:
-            failed += 1
-
-        # 50건마다 진행 상황 출력
-        if (i + 1) % 50 == 0 or (i + 1) == total:
-            remaining = total - (i + 1)
-            print(f"\r[sent] {i+1}/{total} 완료 (성공: {count}, 실패: {failed}, 잔여: {remaining})", end="", flush=True)
+    # 레코드 단위 요청은 서로 독립적이므로 스레드 풀로 왕복 지연을 겹침
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for start in range(0, total, BATCH_SIZE):
+            chunk = to_migrate[start:start + BATCH_SIZE]
+            records = [db.build_sent_record(content_hash) for content_hash in chunk]
+
+            try:
+                created = db.batch_create("funeral_sent", records)
+            except requests.exceptions.RequestException as e:
+                # 서버 반영 여부를 알 수 없음 → 폴백 재저장 시 중복 위험이 있으므로 중단
+                print()
+                logger.error(f"batch 결과 확인 불가 - 전송 기록 마이그레이션 중단 (재실행 시 저장된 항목은 건너뜀): {e}")
+                break
+            if created is None:
+                # batch API 사용 불가 → 레코드 단위로 폴백 (건별로 존재 여부 확인)
+                created = sum(
+                    1 for result in executor.map(lambda h: _mark_as_sent_if_missing(db, h), chunk)
+                    if result
+                )
+            count += created
+            failed += len(chunk) - created
+
+            # 전송 dedup의 단일 진실원천(analyzed.is_sent)도 함께 갱신
+            list(executor.map(db.mark_analyzed_sent_by_hash, chunk))
+
+            done = start + len(chunk)
+            print(f"\r[sent] {done}/{total} 완료 (성공: {count}, 실패: {failed}, 잔여: {total - done})", end="", flush=True)
 
     print()  # 줄바꿈
     logger.info(f"전송 기록 마이그레이션 완료: {count}건")
@@ -4,6 +4,7 @@
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 import re
@@ -13,6 +14,9 @@ from core.http_client import HttpClient
 
 logger = logging.getLogger(__name__)
 
+# goPage(n) 형태의 onclick 페이지 이동 패턴 (OnClickScraper 및 구청별 스크래퍼 공용)
+GOPAGE_RE = re.compile(r'goPage\((\d+)\)')
+
 
 class BaseScraper(ABC):
     """
@@ -26,10 +30,18 @@ class BaseScraper(ABC):
     - pagination_selector: 페이지네이션 영역 CSS 셀렉터
     """
 
+    # 구청 사이트 1곳에 대한 동시 요청 수 (소규모 관공서 서버 부하 제한)
+    max_workers: int = 4
+
     def __init__(self, http_client: HttpClient, district_name: str):
         self.client = http_client
         self.district = district_name
         self.force_tor = False  # 기본값: Tor 강제 사용 안 함
+        # 서브클래스가 page_param_pattern을 재정의할 수 있으므로 인스턴스 생성 시 컴파일
+        self._page_re = re.compile(self.page_param_pattern)
+        # 목록 URL 템플릿을 {page} 기준으로 미리 분리 (페이지마다 str.format 파싱 생략)
+        prefix, sep, suffix = self.list_url_template.partition("{page}")
+        self._list_url_parts = (prefix, suffix) if sep else None
 
     @property
     @abstractmethod
@@ -71,13 +83,25 @@ class BaseScraper(ABC):
         """줄바꿈 태그 (<br/>, <br>, <br /> 등)"""
         return "<br/>"
 
+    def _parse(self, html: str) -> BeautifulSoup:
+        """HTML 파싱 (html.parser 유지)
+
+        목록 셀렉터는 트리 구조에 의존하고 본문은 저장된 content와 비교되므로,
+        잘못된 마크업을 다르게 보정하는 파서(lxml 등)로 바꾸면
+        URL 누락이나 기존 게시물 전체 재발송이 발생할 수 있다.
+        """
+        return BeautifulSoup(html, "html.parser")
+
     def get_list_url(self, page: int) -> str:
         """목록 페이지 URL 생성"""
-        return self.list_url_template.format(page=page)
+        if self._list_url_parts is None:
+            return self.list_url_template.format(page=page)
+        prefix, suffix = self._list_url_parts
+        return f"{prefix}{page}{suffix}"
 
     def parse_urls(self, html: str) -> List[str]:
         """목록 페이지에서 상세 URL 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         container = soup.select_one(self.list_selector)
         if not container:
             logger.warning(f"{self.district}: 목록 컨테이너를 찾을 수 없음")
@@ -91,7 +115,7 @@ class BaseScraper(ABC):
         """상세 페이지에서 본문 추출"""
         # 줄바꿈 태그를 실제 줄바꿈으로 변환
         html = html.replace(self.br_tag, "\n")
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse(html)
         container = soup.select_one(self.content_selector)
         if not container:
             logger.warning(f"{self.district}: 본문 컨테이너를 찾을 수 없음")
@@ -101,7 +125,7 @@ class BaseScraper(ABC):
 
     def get_last_page_num(self, html: str) -> int:
         """페이지네이션에서 마지막 페이지 번호 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         pagination = soup.select_one(self.pagination_selector)
         if not pagination:
             return 1
@@ -112,7 +136,7 @@ class BaseScraper(ABC):
 
         # 마지막 링크에서 페이지 번호 추출
         last_href = links[-1].get("href", "")
-        match = re.search(self.page_param_pattern, last_href)
+        match = self._page_re.search(last_href)
         if match:
             return int(match.group(1))
 
@@ -121,15 +145,11 @@ class BaseScraper(ABC):
     def fetch_urls(self, page: int) -> List[str]:
         """목록 페이지에서 URL 목록 가져오기"""
         url = self.get_list_url(page)
-        response = self.client.get(url, force_tor=self.force_tor)
-        response.encoding = "utf-8"
-        return self.parse_urls(response.text)
+        return self.parse_urls(self.client.get_text(url, force_tor=self.force_tor))
 
     def fetch_content(self, url: str) -> str:
         """상세 페이지에서 본문 가져오기"""
-        response = self.client.get(url, force_tor=self.force_tor)
-        response.encoding = "utf-8"
-        return self.parse_content(response.text)
+        return self.parse_content(self.client.get_text(url, force_tor=self.force_tor))
 
     def scrape(self, max_page: int = 1) -> List[Dict[str, str]]:
         """
@@ -143,22 +163,32 @@ class BaseScraper(ABC):
         """
         # 첫 페이지 로드하여 전체 페이지 수 확인
         first_url = self.get_list_url(1)
-        response = self.client.get(first_url, force_tor=self.force_tor)
-        response.encoding = "utf-8"
+        first_html = self.client.get_text(first_url, force_tor=self.force_tor)
 
-        last_page = self.get_last_page_num(response.text)
+        last_page = self.get_last_page_num(first_html)
         if last_page > max_page:
             last_page = max_page
 
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 1페이지는 이미 받은 HTML 재사용
+            urls = self.parse_urls(first_html)
+            for page_urls in executor.map(self.fetch_urls, range(2, last_page + 1)):
+                urls.extend(page_urls)
+            return self._fetch_contents(executor, urls)
+
+    def _fetch_contents(self, executor: ThreadPoolExecutor, urls: List[str]) -> List[Dict[str, str]]:
+        """상세 페이지 본문 병렬 수집 (목록 순서 유지, 중복 URL은 1회만, 개별 실패는 건너뜀)"""
+        # 페이지 간 중복(상단 고정글, 수집 중 밀려난 게시물) 제거
+        unique_urls = dict.fromkeys(urls)
+        futures = [(url, executor.submit(self.fetch_content, url)) for url in unique_urls]
+
         results = []
-        for page in range(1, last_page + 1):
-            urls = self.fetch_urls(page)
-            for url in urls:
-                try:
-                    content = self.fetch_content(url)
-                    results.append({"url": url, "content": content})
-                except Exception as e:
-                    logger.error(f"{self.district}: URL 처리 실패 - {url}: {e}")
+        for url, future in futures:
+            try:
+                content = future.result()
+                results.append({"url": url, "content": content})
+            except Exception as e:
+                logger.error(f"{self.district}: URL 처리 실패 - {url}: {e}")
 
         return results
 
@@ -171,7 +201,7 @@ class OnClickScraper(BaseScraper):
 
     def parse_urls(self, html: str) -> List[str]:
         """onclick 속성에서 URL 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         container = soup.select_one(self.list_selector)
         if not container:
             return []
@@ -191,7 +221,7 @@ class OnClickScraper(BaseScraper):
 
     def get_last_page_num(self, html: str) -> int:
         """goPage() 형태의 페이지네이션에서 마지막 페이지 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         pagination = soup.select_one(self.pagination_selector)
         if not pagination:
             return 1
@@ -202,7 +232,7 @@ class OnClickScraper(BaseScraper):
 
         # 마지막 onclick에서 페이지 번호 추출
         last_onclick = links[-1].get("onclick", "")
-        match = re.search(r'goPage\((\d+)\)', last_onclick)
+        match = GOPAGE_RE.search(last_onclick)
         if match:
             return int(match.group(1))
 
@@ -225,27 +255,27 @@ class BlogStyleScraper(BaseScraper):
         블로그 형식 스크래핑 - 목록에서 바로 content 추출
         """
         first_url = self.get_list_url(1)
-        response = self.client.get(first_url, force_tor=self.force_tor)
-        response.encoding = "utf-8"
+        first_html = self.client.get_text(first_url, force_tor=self.force_tor)
 
-        last_page = self.get_last_page_num(response.text)
+        last_page = self.get_last_page_num(first_html)
         if last_page > max_page:
             last_page = max_page
 
-        results = []
-        for page in range(1, last_page + 1):
-            url = self.get_list_url(page)
-            response = self.client.get(url, force_tor=self.force_tor)
-            response.encoding = "utf-8"
-
-            items = self.parse_list_items(response.text)
-            results.extend(items)
-
+        # 1페이지는 이미 받은 HTML 재사용
+        results = self.parse_list_items(first_html)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for items in executor.map(self.fetch_list_items, range(2, last_page + 1)):
+                results.extend(items)
         return results
 
+    def fetch_list_items(self, page: int) -> List[Dict[str, str]]:
+        """목록 페이지에서 URL과 content 가져오기"""
+        url = self.get_list_url(page)
+        return self.parse_list_items(self.client.get_text(url, force_tor=self.force_tor))
+
     def parse_list_items(self, html: str) -> List[Dict[str, str]]:
         """목록에서 URL과 content 동시 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         container = soup.select_one(self.list_selector)
         if not container:
             logger.warning(f"{self.district}: 목록 컨테이너를 찾을 수 없음")
@@ -280,13 +310,11 @@ class PostMethodScraper(BaseScraper):
 
     def fetch_list_html(self, page: int) -> str:
         """POST 방식으로 목록 HTML 가져오기"""
-        response = self.client.post(
+        return self.client.post_text(
             self.post_url,
             data=self.get_post_params(page),
             force_tor=self.force_tor
         )
-        response.encoding = "utf-8"
-        return response.text
 
     def scrape(self, max_page: int = 1) -> List[Dict[str, str]]:
         """POST 방식 스크래핑"""
@@ -296,15 +324,9 @@ class PostMethodScraper(BaseScraper):
         if last_page > max_page:
             last_page = max_page
 
-        results = []
-        for page in range(1, last_page + 1):
-            html = self.fetch_list_html(page)
-            urls = self.parse_urls(html)
-            for url in urls:
-                try:
-                    content = self.fetch_content(url)
-                    results.append({"url": url, "content": content})
-                except Exception as e:
-                    logger.error(f"{self.district}: URL 처리 실패 - {url}: {e}")
-
-        return results
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 1페이지는 이미 받은 HTML 재사용
+            urls = self.parse_urls(first_html)
+            for html in executor.map(self.fetch_list_html, range(2, last_page + 1)):
+                urls.extend(self.parse_urls(html))
+            return self._fetch_contents(executor, urls)
@@ -4,14 +4,18 @@
 """
 
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
 import re
 import os
 
-from scrapers.base import BaseScraper, OnClickScraper, BlogStyleScraper, PostMethodScraper
+from scrapers.base import GOPAGE_RE, BaseScraper, OnClickScraper, BlogStyleScraper, PostMethodScraper
 from core.http_client import HttpClient
 
 
+_P_IDX_RE = re.compile(r'data-req-get-p-idx="(\d+)"')
+_SUBSTANCE_RE = re.compile(r'<div class="substanceautolink">(.*?)</div>', re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
 # ==================== 표준 스크래퍼 (직접 연결) ====================
 
 class BukguScraper(BaseScraper):
@@ -88,7 +92,7 @@ class DongnaeScraper(BaseScraper):
     def parse_content(self, html: str) -> str:
         """상세 페이지에서 본문 추출 (레거시 방식 - 조회수 셀 삭제)"""
         html = html.replace("<br/>", "\n")
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse(html)
 
         # 조회수 셀 삭제 (레거시 방식)
         view_count_cell = soup.select_one("#view > table > tbody > tr:nth-child(2) > td:nth-child(6)")
@@ -135,7 +139,7 @@ class GangseoScraper(PostMethodScraper):
 
     def parse_urls(self, html: str) -> List[str]:
         """regex로 data-req-get-p-idx 추출"""
-        idxs = re.findall(r'data-req-get-p-idx="(\d+)"', html)
+        idxs = _P_IDX_RE.findall(html)
         return [
             f"{self.base_url}/welfare/board/post/view.do?bcIdx=567&mid=0604030000&&idx={idx}"
             for idx in idxs
@@ -143,7 +147,7 @@ class GangseoScraper(PostMethodScraper):
 
     def get_last_page_num(self, html: str) -> int:
         """goPage() 형태에서 마지막 페이지 추출"""
-        numbers = re.findall(r'goPage\((\d+)\)', html)
+        numbers = GOPAGE_RE.findall(html)
         if numbers:
             return max(map(int, numbers))
         return 1
@@ -175,7 +179,7 @@ class GijangScraper(BaseScraper):
     def parse_content(self, html: str) -> str:
         """레거시 방식 - 테이블 병합 처리 후 key:value 포맷"""
         html = html.replace("<br/>", "\n")
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse(html)
         container = soup.select_one(self.content_selector)
         if not container:
             return ""
@@ -331,7 +335,7 @@ class YeongdoguScraper(BaseScraper):
 
     def parse_urls(self, html: str) -> List[str]:
         """목록에서 URL 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         container = soup.find("ul", "lst1")
         if not container:
             return []
@@ -356,18 +360,16 @@ class YeongdoguScraper(BaseScraper):
 
         try:
             # 상세 페이지 가져오기
-            response = self.client.get(url, force_tor=self.force_tor)
-            response.encoding = "utf-8"
-            html_text = response.text
-            soup = BeautifulSoup(html_text.replace("<br/>", "\n"), "html.parser")
+            html_text = self.client.get_text(url, force_tor=self.force_tor)
+            soup = self._parse(html_text.replace("<br/>", "\n"))
 
             # 1. 먼저 텍스트 직접 추출 시도 (substanceautolink div)
             if "substanceautolink" in html_text:
-                match = re.search(r'<div class="substanceautolink">(.*?)</div>', html_text, re.DOTALL)
+                match = _SUBSTANCE_RE.search(html_text)
                 if match:
                     raw_content = match.group(1)
                     # HTML 태그와 엔티티 정리
-                    text_content = re.sub(r'<[^>]+>', '\n', raw_content)
+                    text_content = _TAG_RE.sub('\n', raw_content)
                     text_content = text_content.replace('&nbsp;', ' ')
                     text_content = '\n'.join(line.strip() for line in text_content.split('\n') if line.strip())
 
@@ -476,7 +478,7 @@ class YeonjeScraper(PostMethodScraper):
 
     def parse_urls(self, html: str) -> List[str]:
         """onclick에서 URL 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         table = soup.find("table", "bod_list")
         if not table:
             return []
@@ -498,7 +500,7 @@ class YeonjeScraper(PostMethodScraper):
 
     def get_last_page_num(self, html: str) -> int:
         """goPage() 형태에서 마지막 페이지 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         pagination = soup.find("div", "bod_page")
         if not pagination:
             return 1
@@ -508,7 +510,7 @@ class YeonjeScraper(PostMethodScraper):
             return 1
 
         last_onclick = links[-1].get("onclick", "")
-        match = re.search(r'goPage\((\d+)\)', last_onclick)
+        match = GOPAGE_RE.search(last_onclick)
         if match:
             return int(match.group(1))
         return 1
@@ -556,7 +558,7 @@ class SahaScraper(OnClickScraper):
 
     def parse_urls(self, html: str) -> List[str]:
         """onclick에서 URL 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         table = soup.find("table", "tableSt_list")
         if not table:
             return []
@@ -653,7 +655,7 @@ class GeumjeongScraper(BaseScraper):
 
     def get_last_page_num(self, html: str) -> int:
         """금정구 특수 페이지네이션 처리"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._parse(html)
         pagination = soup.select_one(self.pagination_selector)
         if not pagination:
             return 1
@@ -667,7 +669,7 @@ class GeumjeongScraper(BaseScraper):
             return 1
 
         last_href = links[-1].get("href", "")
-        match = re.search(self.page_param_pattern, last_href)
+        match = self._page_re.search(last_href)
         if match:
             return int(match.group(1))
 
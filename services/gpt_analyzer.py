@@ -1,33 +1,79 @@
 """
 GPT 분석 서비스
-GPT-4o를 사용하여 부고 정보 추출
+GPT-4o-mini + Structured Outputs(JSON Schema)로 부고 정보 추출
 """
 
+import atexit
 import json
 import logging
-from typing import Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트 입력 토큰 절감을 위한 공백 정리 패턴
+_INLINE_SPACE_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
 
 class GPTAnalyzer:
-    """GPT-4o 기반 부고 정보 추출기"""
+    """GPT 기반 부고 정보 추출기"""
 
     EXTRACTION_TAGS = [
         '이름', '생년월일', '거주지', '사망일시', '사망장소',
         '장례일정', '장례장소', '발인일시', '화장일시'
     ]
 
-    PROMPT_TEMPLATE = """아래의 <공영장례 정보>에서 [이름, 생년월일, 거주지, 사망일시, 사망장소, 장례일정, 장례장소, 발인일시, 화장일시]을 JSON 형태로 추출해줘. 단, 그외의 사항은 [그 외의 사항]으로 분류해주면 돼.(없는 값은 억지로 찾지마. 그러면 혼난다.)
+    PROMPT_TEMPLATE = """아래의 <공영장례 정보>에서 [이름, 생년월일, 거주지, 사망일시, 사망장소, 장례일정, 장례장소, 발인일시, 화장일시]을 추출해줘. 원문에 없는 항목은 null로 둬.
 <공영장례 정보>
 {content}"""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o"):
+    # 응답 구조 고정 (모든 항목은 문자열 또는 null)
+    RESPONSE_FORMAT = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "obituary",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    tag: {"type": ["string", "null"]} for tag in EXTRACTION_TAGS
+                },
+                "required": list(EXTRACTION_TAGS),
+                "additionalProperties": False
+            }
+        }
+    }
+
+    # 부고 원문 최대 길이 (부고는 짧으므로 비정상적으로 긴 본문만 잘림)
+    MAX_CONTENT_CHARS = 4000
+
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
         self.api_key = api_key
         self.model = model
         self.api_url = "https://api.openai.com/v1/chat/completions"
 
+        # api.openai.com keep-alive 연결 재사용 (analyze_many 워커 간 공유)
+        # 429(요청 한도)/5xx는 지수 백오프로 재시도, Retry-After 헤더가 있으면 우선
+        # 읽기 오류/타임아웃은 서버가 이미 처리(과금) 중일 수 있으므로 재시도하지 않음
+        # (연결 실패는 요청이 전달되지 않았으므로 재시도)
+        retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=16))
+        atexit.register(self.session.close)
+
     def analyze(self, content: str) -> Dict[str, Any]:
         """
         부고 내용 분석
@@ -38,16 +84,16 @@ class GPTAnalyzer:
         Returns:
             추출된 정보 딕셔너리
         """
-        prompt = self.PROMPT_TEMPLATE.format(content=content.replace(",", "."))
+        prompt = self.PROMPT_TEMPLATE.format(content=self._compact(content))
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 json={
                     "model": self.model,
                     "messages": [{"role": "user", "content": prompt}],
-                    "response_format": {"type": "json_object"},
+                    "response_format": self.RESPONSE_FORMAT,
                     "temperature": 0.0
                 },
                 timeout=60
@@ -56,14 +102,7 @@ class GPTAnalyzer:
 
             data = response.json()
             result_text = data["choices"][0]["message"]["content"]
-            result = json.loads(result_text)
-
-            # 키 정규화 (공백 제거)
-            normalized = {}
-            for key, value in result.items():
-                normalized[key.replace(" ", "")] = value
-
-            return normalized
+            return json.loads(result_text)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"GPT API 요청 실패: {e}")
@@ -75,6 +114,11 @@ class GPTAnalyzer:
             logger.error(f"GPT 응답 구조 오류: {e}")
             raise
 
+    def _compact(self, content: str) -> str:
+        """연속 공백/빈 줄 정리 및 길이 제한"""
+        content = _INLINE_SPACE_RE.sub(' ', _BLANK_LINES_RE.sub('\n\n', content)).strip()
+        return content[:self.MAX_CONTENT_CHARS]
+
     def analyze_raw_data(self, raw_data: Dict[str, str]) -> Dict[str, Any]:
         """
         원본 데이터 분석 (기존 EXEC_PROMPT 대체)
@@ -95,6 +139,54 @@ class GPTAnalyzer:
             "content": extracted
         }
 
+    def analyze_many(
+        self,
+        items: List[Dict[str, str]],
+        concurrency: int = 8
+    ) -> Iterator[Union[Dict[str, Any], Exception]]:
+        """
+        여러 원본 데이터 병렬 분석
+
+        Args:
+            items: analyze_raw_data 입력 목록
+            concurrency: 동시 GPT 요청 수
+
+        Returns:
+            입력 순서대로 분석 결과를 내는 이터레이터
+            (실패한 항목은 발생한 예외 객체, 나머지 항목 처리는 계속됨)
+        """
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            yield from executor.map(self._analyze_safely, items)
+
+    def _analyze_safely(self, raw_data: Dict[str, str]) -> Union[Dict[str, Any], Exception]:
+        """analyze_raw_data 래퍼 (예외를 결과로 반환)"""
+        try:
+            return self.analyze_raw_data(raw_data)
+        except Exception as e:
+            return e
+
+
+# 정리 대상 항목 (GPT 추출 항목과 동일)
+_CLEAN_TAGS = tuple(GPTAnalyzer.EXTRACTION_TAGS)
+
+# 추출 실패로 간주하는 값
+_EMPTY_VALUES = frozenset({"그 외의 사항", "", "없음"})
+
+
+def _convert_value(value: Any) -> str:
+    """값 변환 (대부분 문자열이므로 먼저 검사)"""
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, dict):
+        parts = [f"{k}:{_convert_value(v)}" for k, v in value.items()]
+        return "\n".join(parts)
+    elif isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    elif value is None:
+        return "추출 실패"
+    else:
+        return str(value)
+
 
 def clean_analyzed_data(data: Dict[str, Any]) -> Dict[str, str]:
     """
@@ -106,32 +198,15 @@ def clean_analyzed_data(data: Dict[str, Any]) -> Dict[str, str]:
     Returns:
         정리된 딕셔너리
     """
-    TAGS = [
-        '이름', '생년월일', '거주지', '사망일시', '사망장소',
-        '장례일정', '장례장소', '발인일시', '화장일시'
-    ]
-
-    def convert_value(value: Any) -> str:
-        """값 변환"""
-        if isinstance(value, dict):
-            parts = [f"{k}:{convert_value(v)}" for k, v in value.items()]
-            return "\n".join(parts)
-        elif isinstance(value, list):
-            return ", ".join(str(v) for v in value)
-        elif value is None:
-            return "추출 실패"
-        else:
-            return str(value)
-
     content = data.get("content", {})
     result = {}
 
-    for tag in TAGS:
+    for tag in _CLEAN_TAGS:
         value = content.get(tag, "추출 실패")
-        converted = convert_value(value)
+        converted = _convert_value(value)
 
         # 빈 값 처리
-        if converted in ["그 외의 사항", "", "없음", None]:
+        if converted in _EMPTY_VALUES:
             converted = "추출 실패"
 
         result[tag] = converted
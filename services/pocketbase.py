@@ -5,7 +5,7 @@ DB 작업 추상화
 
 import hashlib
 from datetime import datetime, timezone, timedelta
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple
 import logging
 import requests
 
@@ -15,6 +15,15 @@ logger = logging.getLogger(__name__)
 KST = timezone(timedelta(hours=9))
 
 
+def make_content_hash(url: str, content: str) -> str:
+    """funeral_raw.content_hash 계산 (url + content)
+
+    content_hash는 DB에 저장되어 analyzed/sent 레코드 및 기존 JSON 데이터의 hash와
+    매칭되는 식별자이므로 알고리즘(sha256)을 바꾸면 안 된다.
+    """
+    return hashlib.sha256((url + content).encode()).hexdigest()
+
+
 class PocketbaseClient:
     """
     Pocketbase REST API 클라이언트
@@ -34,6 +43,7 @@ class PocketbaseClient:
         self.token: Optional[str] = None
         self._on_error: Optional[Callable[[str, str], None]] = None
         self._notified_errors: set = set()  # 중복 알림 방지
+        self._batch_available = True  # batch API 실패 후에는 레코드 단위 생성만 사용
 
     def set_error_callback(self, callback: Callable[[str, str], None]):
         """에러 발생 시 호출할 콜백 설정 (텔레그램 등)
@@ -135,6 +145,71 @@ class PocketbaseClient:
             logger.error(f"Pocketbase 요청 오류: {e}")
             return None
 
+    def batch_create(
+        self,
+        collection: str,
+        records: List[Dict[str, Any]],
+        _retried: bool = False
+    ) -> Optional[int]:
+        """여러 레코드를 batch API(/api/batch)로 한 번에 생성
+
+        Pocketbase batch는 트랜잭션으로 처리되어 전부 성공하거나 전부 실패한다.
+        batch API가 비활성화되어 있거나(기본값, 403) 서버가 요청을 거부(4xx)하면 None을 반환한다
+        → 아무것도 저장되지 않았으므로 호출부는 레코드 단위 생성으로 폴백할 것.
+        한 번 거부되면 이후 호출은 요청 없이 바로 None을 반환한다.
+        (records 수는 서버의 batch maxRequests 설정(기본 50) 이하여야 함)
+
+        Returns:
+            생성된 레코드 수 (거부 시 None)
+
+        Raises:
+            requests.exceptions.RequestException: 타임아웃/연결 오류/5xx
+                → 서버 반영 여부를 알 수 없으므로 폴백하지 말고 중단할 것
+        """
+        if not records:
+            return 0
+        if not self._batch_available:
+            return None
+        if not self.token:
+            if not self.authenticate():
+                logger.error("인증 실패로 batch 요청 중단")
+                return None
+        try:
+            response = requests.post(
+                f"{self.base_url}/api/batch",
+                headers=self._headers(),
+                json={
+                    "requests": [
+                        {
+                            "method": "POST",
+                            "url": f"/api/collections/{collection}/records",
+                            "body": record
+                        }
+                        for record in records
+                    ]
+                },
+                timeout=60
+            )
+            response.raise_for_status()
+            return len(response.json())
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code
+            if status >= 500:
+                # 서버 오류는 트랜잭션 커밋 여부를 알 수 없음 → 호출부로 전파
+                raise
+            if not _retried and status == 401:
+                logger.warning("batch 인증 오류 (HTTP 401), 재인증 시도...")
+                self.token = None
+                if self.authenticate():
+                    return self.batch_create(collection, records, _retried=True)
+            self._batch_available = False
+            if status == 403:
+                # batch API 비활성화 상태 (Pocketbase 기본값) - 토큰 문제가 아님
+                logger.warning("batch API 비활성화됨 (HTTP 403) - 레코드 단위 생성으로 진행")
+            else:
+                logger.error(f"Pocketbase batch 요청 거부 ({collection}, {len(records)}건): {e} | 응답: {e.response.text[:500]}")
+            return None
+
     # ==================== funeral_raw ====================
 
     def get_raw_by_district(self, district: str) -> List[Dict]:
@@ -183,7 +258,7 @@ class PocketbaseClient:
         update_count: int = 0
     ) -> Optional[Dict]:
         """원본 데이터 추가"""
-        content_hash = hashlib.sha256((url + content).encode()).hexdigest()
+        content_hash = make_content_hash(url, content)
         return self._request(
             "POST",
             "funeral_raw/records",
@@ -202,6 +277,19 @@ class PocketbaseClient:
         contents = self.get_raw_contents_by_district(district)
         return content in contents
 
+    def get_raw_keys(self) -> Optional[Set[Tuple[str, str]]]:
+        """저장된 RAW의 (content, district) 집합 (fail-closed).
+
+        raw_exists와 같은 기준(구청 내 동일 내용이면 URL과 무관하게 중복)을 한 번의 조회로 제공한다.
+        조회 실패 시 None을 반환한다 → 호출부는 중복 저장 방지를 위해 작업을 중단할 것.
+        """
+        records = self._fetch_all_pages(
+            "funeral_raw/records", {"fields": "content,district"}
+        )
+        if records is None:
+            return None
+        return {(r.get("content"), r.get("district")) for r in records}
+
     def count_same_url(self, url: str, district: str) -> int:
         """동일 URL 레코드 수 (수정 횟수 계산용)"""
         result = self._request(
@@ -216,6 +304,19 @@ class PocketbaseClient:
 
     # ==================== funeral_analyzed ====================
 
+    def get_content_hashes(self, collection: str) -> Optional[Set[str]]:
+        """컬렉션에 저장된 content_hash 집합 (fail-closed).
+
+        조회 실패 시 None을 반환한다 → 호출부는 중복 저장 방지를 위해 작업을 중단할 것.
+        (get_analyzed_hashes/get_sent_hashes는 실패 시 일부 또는 빈 목록을 반환함)
+        """
+        records = self._fetch_all_pages(
+            f"{collection}/records", {"fields": "content_hash"}
+        )
+        if records is None:
+            return None
+        return {r.get("content_hash") for r in records}
+
     def get_analyzed_hashes(self) -> List[str]:
         """분석 완료된 content_hash 목록 (페이지네이션)"""
         # 인증 확인
@@ -323,26 +424,40 @@ class PocketbaseClient:
         return self._request(
             "POST",
             "funeral_analyzed/records",
-            data={
-                "raw_id": raw_id,
-                "content_hash": content_hash,
-                "district": district,
-                "url": url,
-                "update_count": update_count,
-                "name": analyzed_data.get("이름", ""),
-                "birth_date": analyzed_data.get("생년월일", ""),
-                "residence": analyzed_data.get("거주지", ""),
-                "death_datetime": analyzed_data.get("사망일시", ""),
-                "death_place": analyzed_data.get("사망장소", ""),
-                "funeral_schedule": analyzed_data.get("장례일정", ""),
-                "funeral_place": analyzed_data.get("장례장소", ""),
-                "departure_datetime": analyzed_data.get("발인일시", ""),
-                "cremation_datetime": analyzed_data.get("화장일시", ""),
-                "is_sent": False,
-                "analyzed_at": datetime.now(KST).isoformat()
-            }
+            data=self.build_analyzed_record(
+                raw_id, content_hash, district, url, update_count, analyzed_data
+            )
         )
 
+    @staticmethod
+    def build_analyzed_record(
+        raw_id: str,
+        content_hash: str,
+        district: str,
+        url: str,
+        update_count: int,
+        analyzed_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """funeral_analyzed 레코드 본문 생성"""
+        return {
+            "raw_id": raw_id,
+            "content_hash": content_hash,
+            "district": district,
+            "url": url,
+            "update_count": update_count,
+            "name": analyzed_data.get("이름", ""),
+            "birth_date": analyzed_data.get("생년월일", ""),
+            "residence": analyzed_data.get("거주지", ""),
+            "death_datetime": analyzed_data.get("사망일시", ""),
+            "death_place": analyzed_data.get("사망장소", ""),
+            "funeral_schedule": analyzed_data.get("장례일정", ""),
+            "funeral_place": analyzed_data.get("장례장소", ""),
+            "departure_datetime": analyzed_data.get("발인일시", ""),
+            "cremation_datetime": analyzed_data.get("화장일시", ""),
+            "is_sent": False,
+            "analyzed_at": datetime.now(KST).isoformat()
+        }
+
     # ==================== funeral_sent ====================
 
     def get_sent_hashes(self) -> List[str]:
@@ -419,12 +534,17 @@ class PocketbaseClient:
         return self._request(
             "POST",
             "funeral_sent/records",
-            data={
-                "content_hash": content_hash,
-                "sent_at": datetime.now(KST).isoformat()
-            }
+            data=self.build_sent_record(content_hash)
         )
 
+    @staticmethod
+    def build_sent_record(content_hash: str) -> Dict[str, Any]:
+        """funeral_sent 레코드 본문 생성"""
+        return {
+            "content_hash": content_hash,
+            "sent_at": datetime.now(KST).isoformat()
+        }
+
     def delete_sent(self, record_id: str) -> bool:
         """전송 완료 레코드 삭제"""
         try:
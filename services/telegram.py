@@ -3,12 +3,15 @@
 알림 및 부고 메시지 전송
 """
 
+import atexit
 import datetime
 import html
 import logging
+import threading
 import time
 from typing import Dict, Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 from config import TelegramConfig, DISTRICT_NAMES_KOR_TO_ENG
 
@@ -16,7 +19,48 @@ logger = logging.getLogger(__name__)
 
 # 텔레그램 API 레이트 리밋: 같은 채널 초당 1개
 TELEGRAM_RATE_LIMIT_DELAY = 1.0  # 초
+# 429(Too Many Requests) 응답 시 retry_after 대기 후 재시도 횟수
+TELEGRAM_MAX_RETRIES = 3
 KST = datetime.timezone(datetime.timedelta(hours=9))
+# 알림 메시지 발생시간 표기 형식
+DATETIME_FORMAT = "%Y년 %m월 %d일 %H시 %M분 %S초"
+
+
+class ChatRateLimiter:
+    """
+    채널별 전송 간격 제한 (스레드 안전)
+
+    같은 채널은 TELEGRAM_RATE_LIMIT_DELAY 간격으로 전송하고, 채널 간에는 대기하지 않는다.
+    429 응답의 retry_after는 defer()로 반영해 같은 채널의 다른 전송도 함께 늦춘다.
+    """
+
+    def __init__(self, delay: float = TELEGRAM_RATE_LIMIT_DELAY):
+        self.delay = delay
+        # 채널별 다음 전송 가능 시각 (time.monotonic 기준)
+        self._next_send_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, chat_id: str):
+        """전송 가능 시각까지 대기 후 다음 슬롯 예약"""
+        with self._lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_send_at.get(chat_id, 0.0))
+            self._next_send_at[chat_id] = send_at + self.delay
+        if send_at > now:
+            time.sleep(send_at - now)
+
+    def defer(self, chat_id: str, seconds: float):
+        """채널 전송을 seconds초 뒤로 미룸 (429 retry_after)"""
+        with self._lock:
+            resume_at = time.monotonic() + seconds
+            self._next_send_at[chat_id] = max(self._next_send_at.get(chat_id, 0.0), resume_at)
+
+
+def get_retry_after(result: Dict) -> Optional[float]:
+    """텔레그램 429 응답의 retry_after(초) 추출 (429가 아니면 None)"""
+    if result.get("error_code") != 429:
+        return None
+    return float(result.get("parameters", {}).get("retry_after", TELEGRAM_RATE_LIMIT_DELAY))
 
 
 class TelegramService:
@@ -28,6 +72,13 @@ class TelegramService:
         self.api_base = f"https://api.telegram.org/bot{config.bot_token}"
         self.templates = config.templates
 
+        # api.telegram.org keep-alive 연결 재사용
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        atexit.register(self.session.close)
+
+        self.rate_limiter = ChatRateLimiter()
+
     def _send_message(
         self,
         chat_id: str,
@@ -41,50 +92,58 @@ class TelegramService:
         Returns:
             성공 여부
         """
-        try:
-            response = requests.get(
-                f"{self.api_base}/sendMessage",
-                params={
-                    'chat_id': chat_id,
-                    'text': text,
-                    'parse_mode': parse_mode,
-                    'disable_notification': disable_notification
-                },
-                timeout=10
-            )
-
-            # API 응답 확인
-            result = response.json()
-            if not result.get("ok"):
-                error_code = result.get("error_code", "unknown")
-                description = result.get("description", "no description")
-                logger.error(
-                    f"텔레그램 API 오류 (chat_id={chat_id}): "
-                    f"[{error_code}] {description}"
+        payload = {
+            'chat_id': chat_id,
+            'text': text,
+            'parse_mode': parse_mode,
+            'disable_notification': disable_notification
+        }
+        for attempt in range(TELEGRAM_MAX_RETRIES + 1):
+            self.rate_limiter.wait(chat_id)
+            try:
+                response = self.session.post(
+                    f"{self.api_base}/sendMessage",
+                    json=payload,
+                    timeout=10
                 )
-                print(f"  [TELEGRAM ERROR] chat_id={chat_id}, code={error_code}, desc={description}")
-                return False
 
-            response.raise_for_status()
-
-            # 레이트 리밋 방지 딜레이
-            time.sleep(TELEGRAM_RATE_LIMIT_DELAY)
-            return True
-        except requests.exceptions.RequestException as e:
-            # HTTP 에러 상세 로깅
-            error_detail = str(e)
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    api_response = e.response.json()
-                    error_code = api_response.get("error_code", "unknown")
-                    description = api_response.get("description", "no description")
-                    error_detail = f"[{error_code}] {description}"
-                except:
-                    error_detail = f"HTTP {e.response.status_code}: {e.response.text[:200]}"
-
-            logger.error(f"텔레그램 전송 실패 (chat_id={chat_id}): {error_detail}")
-            print(f"  [TELEGRAM ERROR] chat_id={chat_id}, error={error_detail}")
-            return False
+                # API 응답 확인
+                result = response.json()
+                if not result.get("ok"):
+                    # 레이트 리밋 초과 → retry_after만큼 채널 전송을 미룬 뒤 재시도
+                    retry_after = get_retry_after(result)
+                    if retry_after is not None and attempt < TELEGRAM_MAX_RETRIES:
+                        logger.warning(f"텔레그램 레이트 리밋 (chat_id={chat_id}), {retry_after}초 후 재시도")
+                        self.rate_limiter.defer(chat_id, retry_after)
+                        continue
+
+                    error_code = result.get("error_code", "unknown")
+                    description = result.get("description", "no description")
+                    logger.error(
+                        f"텔레그램 API 오류 (chat_id={chat_id}): "
+                        f"[{error_code}] {description}"
+                    )
+                    print(f"  [TELEGRAM ERROR] chat_id={chat_id}, code={error_code}, desc={description}")
+                    return False
+
+                response.raise_for_status()
+                return True
+            except requests.exceptions.RequestException as e:
+                # HTTP 에러 상세 로깅
+                error_detail = str(e)
+                if hasattr(e, 'response') and e.response is not None:
+                    try:
+                        api_response = e.response.json()
+                        error_code = api_response.get("error_code", "unknown")
+                        description = api_response.get("description", "no description")
+                        error_detail = f"[{error_code}] {description}"
+                    except:
+                        error_detail = f"HTTP {e.response.status_code}: {e.response.text[:200]}"
+
+                logger.error(f"텔레그램 전송 실패 (chat_id={chat_id}): {error_detail}")
+                print(f"  [TELEGRAM ERROR] chat_id={chat_id}, error={error_detail}")
+                return False
+        return False
 
     def send_funeral_notification(
         self,
@@ -131,10 +190,8 @@ class TelegramService:
         # 야간 알림 무음 처리
         is_night = self._is_night_time()
 
-        # 구청 채널에 전송
+        # 구청 채널 → 통합 채널 순차 전송 (채널별 간격은 rate_limiter가 보장)
         success1 = self._send_message(channel_id, message, disable_notification=is_night)
-
-        # 통합 채널에도 전송
         success2 = self._send_message(
             self.config.funeral_main,
             message,
@@ -145,7 +202,7 @@ class TelegramService:
 
     def send_general_notification(self, message: str) -> bool:
         """일반 알림 전송"""
-        date_time = datetime.datetime.now(KST).strftime("%Y년 %m월 %d일 %H시 %M분 %S초")
+        date_time = datetime.datetime.now(KST).strftime(DATETIME_FORMAT)
         text = self.templates.general_notification.format(
             message=html.escape(message),
             datetime=date_time
@@ -165,7 +222,7 @@ class TelegramService:
         add_text: str = ""
     ) -> bool:
         """에러 알림 전송"""
-        date_time = datetime.datetime.now(KST).strftime("%Y년 %m월 %d일 %H시 %M분 %S초")
+        date_time = datetime.datetime.now(KST).strftime(DATETIME_FORMAT)
 
         # 에러 메시지 길이 제한
         if len(error_message) > 1000:
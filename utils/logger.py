@@ -3,18 +3,92 @@
 파일 + 텔레그램 알림 지원
 """
 
+import atexit
 import logging
+import logging.handlers
 import datetime
 import html
+import queue
+import threading
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 
 from config import Config, TelegramConfig
+from services.telegram import TELEGRAM_MAX_RETRIES, ChatRateLimiter, get_retry_after
 
 
 KST = datetime.timezone(datetime.timedelta(hours=9))
+# 알림 메시지 발생시간 표기 형식
+DATETIME_FORMAT = "%Y년 %m월 %d일 %H시 %M분 %S.%f초"
+
+
+class TelegramSender:
+    """
+    텔레그램 메시지 백그라운드 전송기
+
+    로그 호출부가 텔레그램 API 응답(최대 10초)을 기다리지 않도록
+    큐에 넣기만 하고, 데몬 스레드 1개가 순서대로 전송한다.
+    같은 채널은 TELEGRAM_RATE_LIMIT_DELAY 간격으로 보내고, 429 응답은 retry_after만큼 기다려 재시도한다.
+    프로세스 종료 시 남은 메시지를 모두 전송한 뒤 세션을 닫는다.
+    """
+
+    def __init__(self, error_logger: logging.Logger, flush_timeout: float = 30.0):
+        self.error_logger = error_logger
+        self.flush_timeout = flush_timeout
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.rate_limiter = ChatRateLimiter()
+        self._queue: "queue.Queue[Optional[Tuple[str, Dict]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="telegram-sender", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def send(self, url: str, payload: Dict):
+        """전송 요청 (즉시 반환)"""
+        self._queue.put((url, payload))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            url, payload = item
+            self._post(url, payload)
+
+    def _post(self, url: str, payload: Dict):
+        """채널별 간격을 지켜 전송 (429는 retry_after 후 재시도, 그 외 실패는 로그)"""
+        chat_id = payload.get('chat_id')
+        for attempt in range(TELEGRAM_MAX_RETRIES + 1):
+            self.rate_limiter.wait(chat_id)
+            try:
+                result = self.session.post(url, json=payload, timeout=10).json()
+            except Exception as e:
+                self.error_logger.warning(f"텔레그램 전송 실패 (chat_id={chat_id}): {e}")
+                return
+
+            if result.get("ok"):
+                return
+
+            retry_after = get_retry_after(result)
+            if retry_after is not None and attempt < TELEGRAM_MAX_RETRIES:
+                self.rate_limiter.defer(chat_id, retry_after)
+                continue
+
+            self.error_logger.warning(
+                f"텔레그램 API 오류 (chat_id={chat_id}): "
+                f"[{result.get('error_code', 'unknown')}] {result.get('description', 'no description')}"
+            )
+            return
+
+    def close(self):
+        """남은 메시지 전송 후 종료"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(self.flush_timeout)
+        self.session.close()
 
 
 class TelegramHandler(logging.Handler):
@@ -25,6 +99,7 @@ class TelegramHandler(logging.Handler):
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        self.sender = TelegramSender(logging.getLogger(__name__))
 
     def emit(self, record: logging.LogRecord):
         try:
@@ -36,15 +111,11 @@ class TelegramHandler(logging.Handler):
             if len(msg) > 4000:
                 msg = msg[:2000] + "\n\n(...)\n\n" + msg[-1500:]
 
-            requests.get(
-                self.api_url,
-                params={
-                    'chat_id': self.chat_id,
-                    'text': f"<code>{msg}</code>",
-                    'parse_mode': 'HTML',
-                },
-                timeout=10
-            )
+            self.sender.send(self.api_url, {
+                'chat_id': self.chat_id,
+                'text': f"<code>{msg}</code>",
+                'parse_mode': 'HTML',
+            })
         except Exception:
             self.handleError(record)
 
@@ -56,7 +127,11 @@ class ScraperLogger:
         self.config = config
         self.telegram_config = config.telegram
         self.log_path = config.log_path
+        self.api_url = f"https://api.telegram.org/bot{config.telegram.bot_token}/sendMessage"
+        self._file_listener: Optional[logging.handlers.QueueListener] = None
         self._setup_logger()
+        atexit.register(self._stop_file_listener)
+        self.sender = TelegramSender(self.logger)
 
     def _setup_logger(self):
         """로거 설정"""
@@ -65,8 +140,9 @@ class ScraperLogger:
 
         # 기존 핸들러 제거
         self.logger.handlers.clear()
+        self._stop_file_listener()
 
-        # 파일 핸들러
+        # 파일 핸들러 (실제 쓰기는 QueueListener 백그라운드 스레드에서 수행)
         file_handler = logging.FileHandler(
             self.log_path,
             encoding='utf-8'
@@ -77,7 +153,10 @@ class ScraperLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        self._file_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._file_listener.start()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
         # 콘솔 핸들러
         console_handler = logging.StreamHandler()
@@ -89,6 +168,15 @@ class ScraperLogger:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
 
+    def _stop_file_listener(self):
+        """파일 로그 리스너 종료 (큐에 남은 로그를 모두 기록한 뒤 파일 닫기)"""
+        if self._file_listener is None:
+            return
+        self._file_listener.stop()
+        for handler in self._file_listener.handlers:
+            handler.close()
+        self._file_listener = None
+
     def info(self, message: str):
         """일반 로그"""
         self.logger.info(message)
@@ -110,7 +198,7 @@ class ScraperLogger:
         일반 알림 로그 (텔레그램 전송 포함)
         기존 LOG_GENERAL 함수 대체
         """
-        date_time = datetime.datetime.now(KST).strftime("%Y년 %m월 %d일 %H시 %M분 %S.%f초")
+        date_time = datetime.datetime.now(KST).strftime(DATETIME_FORMAT)
         log_msg = f"[일반 통보] {message}\n-({date_time})"
 
         self.logger.info(log_msg)
@@ -129,8 +217,8 @@ class ScraperLogger:
         에러 알림 로그 (텔레그램 전송 포함)
         기존 LOG_ERROR 함수 대체
         """
-        uuid_code = str(uuid.uuid1())
-        date_time = datetime.datetime.now(KST).strftime("%Y년 %m월 %d일 %H시 %M분 %S.%f초")
+        uuid_code = uuid.uuid4().hex[:12]
+        date_time = datetime.datetime.now(KST).strftime(DATETIME_FORMAT)
 
         log_msg = f"""
 ===========================
@@ -147,21 +235,14 @@ class ScraperLogger:
             self._send_telegram_error(function_name, uuid_code, date_time, add_text, error_message)
 
     def _send_telegram_general(self, message: str, date_time: str):
-        """텔레그램 일반 알림 전송"""
-        try:
-            telegram_msg = f'<b>[일반 통보] {message}</b>\n-({date_time})'
-            requests.get(
-                f"https://api.telegram.org/bot{self.telegram_config.bot_token}/sendMessage",
-                params={
-                    'chat_id': self.telegram_config.general_channel,
-                    'text': telegram_msg,
-                    'parse_mode': 'HTML',
-                    'disable_notification': True
-                },
-                timeout=10
-            )
-        except Exception as e:
-            self.logger.warning(f"텔레그램 전송 실패: {e}")
+        """텔레그램 일반 알림 전송 (백그라운드)"""
+        telegram_msg = f'<b>[일반 통보] {message}</b>\n-({date_time})'
+        self.sender.send(self.api_url, {
+            'chat_id': self.telegram_config.general_channel,
+            'text': telegram_msg,
+            'parse_mode': 'HTML',
+            'disable_notification': True
+        })
 
     def _send_telegram_error(
         self,
@@ -171,14 +252,13 @@ class ScraperLogger:
         add_text: str,
         error_message: str
     ):
-        """텔레그램 에러 알림 전송"""
-        try:
-            # 에러 메시지가 너무 길면 잘라서 전송
-            truncated_error = error_message
-            if len(error_message) > 1000:
-                truncated_error = error_message[:500] + '\n\n(...)\n\n' + error_message[-500:]
+        """텔레그램 에러 알림 전송 (백그라운드)"""
+        # 에러 메시지가 너무 길면 잘라서 전송
+        truncated_error = error_message
+        if len(error_message) > 1000:
+            truncated_error = error_message[:500] + '\n\n(...)\n\n' + error_message[-500:]
 
-            telegram_msg = f"""<b>에러 발생 통보({function_name})</b>
+        telegram_msg = f"""<b>에러 발생 통보({function_name})</b>
 
 ① 고유번호({uuid_code})
 ② 발생시간({date_time})
@@ -186,17 +266,11 @@ class ScraperLogger:
 
 <code class="language-python">{html.escape(truncated_error)}</code>"""
 
-            requests.get(
-                f"https://api.telegram.org/bot{self.telegram_config.bot_token}/sendMessage",
-                params={
-                    'chat_id': self.telegram_config.error_channel,
-                    'text': telegram_msg,
-                    'parse_mode': 'HTML'
-                },
-                timeout=10
-            )
-        except Exception as e:
-            self.logger.warning(f"텔레그램 에러 알림 전송 실패: {e}")
+        self.sender.send(self.api_url, {
+            'chat_id': self.telegram_config.error_channel,
+            'text': telegram_msg,
+            'parse_mode': 'HTML'
+        })
 
 
 # 글로벌 로거 인스턴스